@@ -1,4 +1,13 @@
-import os, json, re, sys
+import os, json, re, sys, argparse
+
+# The shared skill-call logger and profiler live in ._/logging next to this directory.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "logging"))
+import skill_profile
+
+PROFILER = skill_profile.start("bootstrap")
+
+import compact_registry
+import skill_loader
 
 def parse_yaml_frontmatter(content):
     """Extracts only the YAML block between --- markers."""
@@ -12,31 +21,38 @@ def parse_yaml_frontmatter(content):
     return data
 
 def main():
-    skill_base_path = "./._/skills"
-    discovered_skills = []
-
-    if os.path.exists(skill_base_path):
-        for skill_id in os.listdir(skill_base_path):
-            skill_dir = os.path.join(skill_base_path, skill_id)
-            skill_md = os.path.join(skill_dir, "SKILL.md")
-
-            if os.path.isdir(skill_dir) and os.path.exists(skill_md):
-                try:
-                    with open(skill_md, 'r') as f:
-                        meta = parse_yaml_frontmatter(f.read())
-                        discovered_skills.append({
-                            "id": skill_id,
-                            "name": meta.get("name", skill_id),
-                            "description": meta.get("description", "No description")
-                        })
-                except Exception as e:
-                    print(f"Error loading {skill_id}: {e}", file=sys.stderr)
-
-    # This output is what Jules sees in his startup context
-    print("--- ASP SKILL REGISTRY START ---")
-    print(json.dumps(discovered_skills, indent=2))
-    print("--- ASP SKILL REGISTRY END ---")
-    print(f"System: {len(discovered_skills)} skills indexed. Ready for task-based activation.")
+    parser = argparse.ArgumentParser(description="Print the ASP skill registry.")
+    compact_registry.add_arguments(parser)
+    args = parser.parse_args()
+    budget = compact_registry.budget_from_args(args)
+
+    with PROFILER.call("registry", sys.argv[1:]):
+        discovered_skills = []
+
+        for skill_id, skill_path in skill_loader.discover_skills():
+            try:
+                with PROFILER.phase("io"):
+                    content = skill_loader.read_skill_frontmatter(skill_path)
+                with PROFILER.phase("parse"):
+                    meta = parse_yaml_frontmatter(content)
+                    discovered_skills.append({
+                        "id": skill_id,
+                        "name": meta.get("name", skill_id),
+                        "description": meta.get("description", "No description")
+                    })
+            except Exception as e:
+                print(f"Error loading {skill_id}: {e}", file=sys.stderr)
+
+        # This output is what Jules sees in his startup context
+        print("--- ASP SKILL REGISTRY START ---")
+        if budget is None:
+            print(json.dumps(discovered_skills, indent=2))
+        else:
+            usage = compact_registry.recent_usage()
+            for line in compact_registry.format_compact(discovered_skills, budget, usage):
+                print(line)
+        print("--- ASP SKILL REGISTRY END ---")
+        print(f"System: {len(discovered_skills)} skills indexed. Ready for task-based activation.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,6 +3,17 @@ import os
 import json
 import re
 import sys
+import zipfile
+import argparse
+
+# The shared skill-call logger and profiler live in ._/logging next to this directory.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "logging"))
+import skill_profile
+
+PROFILER = skill_profile.start("bootstrap")
+
+import compact_registry
+import skill_loader
 
 def parse_yaml_frontmatter(content):
     """Simple regex-based YAML frontmatter parser to avoid PyYAML dependency."""
@@ -19,27 +30,26 @@ def parse_yaml_frontmatter(content):
     return data
 
 def discover_skills(skill_paths):
+    """Find unpacked skill directories and packaged .skill archives (see skill_loader.find_skill)."""
     skills = []
-    for base_path in skill_paths:
-        full_base_path = os.path.abspath(os.path.join(os.getcwd(), base_path))
-        if not os.path.exists(full_base_path):
-            continue
-
-        for item in os.listdir(full_base_path):
-            skill_dir = os.path.join(full_base_path, item)
-            skill_md = os.path.join(skill_dir, "SKILL.md")
-            if os.path.isdir(skill_dir) and os.path.exists(skill_md):
-                try:
-                    with open(skill_md, 'r') as f:
-                        content = f.read()
-                        data = parse_yaml_frontmatter(content)
-                        skills.append({
-                            "name": data.get("name", item),
-                            "description": data.get("description", "No description provided."),
-                            "path": skill_dir
-                        })
-                except Exception as e:
-                    print(f"Warning: Failed to parse {skill_md}: {e}", file=sys.stderr)
+    full_paths = [os.path.abspath(os.path.join(os.getcwd(), base_path)) for base_path in skill_paths]
+    for skill_id, skill_path in skill_loader.discover_skills(full_paths):
+        archive = not os.path.isdir(skill_path)
+        try:
+            with PROFILER.phase("io"):
+                content = skill_loader.read_skill_frontmatter(skill_path)
+            with PROFILER.phase("parse"):
+                data = parse_yaml_frontmatter(content)
+                skill = {
+                    "name": data.get("name", skill_id),
+                    "description": data.get("description", "No description provided."),
+                    "path": skill_path
+                }
+                if archive:
+                    skill["archive"] = True
+                skills.append(skill)
+        except (OSError, KeyError, UnicodeDecodeError, zipfile.BadZipFile) as e:
+            print(f"Warning: Failed to read {skill_path}: {e}", file=sys.stderr)
     return skills
 
 def check_env():
@@ -50,32 +60,49 @@ def check_env():
     return results
 
 def main():
-    # Robust config traversal
-    skill_paths = agent_config.get("knowledge", {}).get("skill_paths", ["./._/skills"])
-
-    skills = discover_skills(skill_paths)
-    env_status = check_env()
-
-    output = {
-        "skills": skills,
-        "environment": env_status
-    }
-
-    # Print JSON output for machine consumption
-    print("--- BOOTSTRAP DATA START ---")
-    print(json.dumps(output, indent=2))
-    print("--- BOOTSTRAP DATA END ---")
-
-    # Print Human readable summary
-    print("\n# Agent Bootstrap Summary\n")
-    print(f"**Config Found:** {'Yes' if config else 'No'}")
-    print(f"**Skills Discovered:** {len(skills)}")
-    for s in skills:
-        print(f"- **{s['name']}**: {s['description']}")
-
-    print("\n**Environment Variables:**")
-    for var, status in env_status.items():
-        print(f"- {var}: {status}")
+    parser = argparse.ArgumentParser(description="Initialize the agent context.")
+    compact_registry.add_arguments(parser)
+    args = parser.parse_args()
+    budget = compact_registry.budget_from_args(args)
+
+    with PROFILER.call("bootstrap", sys.argv[1:]):
+        # Robust config traversal (no agent config file is loaded yet, so defaults apply)
+        config = {}
+        skill_paths = config.get("knowledge", {}).get("skill_paths", skill_loader.SKILL_PATHS)
+
+        skills = discover_skills(skill_paths)
+        env_status = check_env()
+
+        if budget is not None:
+            # One dense section instead of JSON plus a repeated markdown summary
+            usage = compact_registry.recent_usage()
+            print("--- BOOTSTRAP DATA START ---")
+            for line in compact_registry.format_compact(skills, budget, usage):
+                print(line)
+            print("env: " + ", ".join(f"{var}={status}" for var, status in env_status.items()))
+            print("--- BOOTSTRAP DATA END ---")
+            return
+
+        output = {
+            "skills": skills,
+            "environment": env_status
+        }
+
+        # Print JSON output for machine consumption
+        print("--- BOOTSTRAP DATA START ---")
+        print(json.dumps(output, indent=2))
+        print("--- BOOTSTRAP DATA END ---")
+
+        # Print Human readable summary
+        print("\n# Agent Bootstrap Summary\n")
+        print(f"**Config Found:** {'Yes' if config else 'No'}")
+        print(f"**Skills Discovered:** {len(skills)}")
+        for s in skills:
+            print(f"- **{s['name']}**: {s['description']}")
+
+        print("\n**Environment Variables:**")
+        for var, status in env_status.items():
+            print(f"- {var}: {status}")
 
 if __name__ == "__main__":
     main()
@@ -12,7 +12,7 @@ if [ ! -f "$BOOTSTRAP_PY" ]; then
 fi
 
 # Run the python bootstrap script
-python3 "$BOOTSTRAP_PY"
+python3 "$BOOTSTRAP_PY" "$@"
 
 echo ""
 echo "Bootstrap complete. You are ready to work."
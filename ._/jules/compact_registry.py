@@ -0,0 +1,120 @@
+"""Compact, budgeted skill registry output for agent start-up.
+
+Emits one `name: description` line per skill instead of indented JSON plus a
+repeated markdown summary. Skills are ranked by recent usage from the
+skill-call log, and descriptions are shortened (lowest-ranked first) until the
+registry fits the character budget.
+"""
+import os
+import re
+import sys
+import json
+
+# The bootstraps put ._/logging on sys.path before importing this module.
+from skill_log import LOG_PATH
+
+CHARS_PER_TOKEN = 4
+DEFAULT_BUDGET = 2000
+MIN_DESCRIPTION = 24
+# Only the tail of the live log is read; older calls say little about current use.
+USAGE_TAIL_BYTES = 256 * 1024
+
+def budget_from_args(args):
+    """Resolve the character budget from --budget/--budget-tokens or the environment; None means not compact."""
+    if args.budget_tokens is not None:
+        return max(args.budget_tokens, 0) * CHARS_PER_TOKEN
+    if args.budget is not None:
+        return max(args.budget, 0)
+    env_budget = os.environ.get("ASP_REGISTRY_BUDGET")
+    if env_budget:
+        try:
+            return max(int(env_budget), 0)
+        except ValueError:
+            print(f"Warning: ignoring non-numeric ASP_REGISTRY_BUDGET={env_budget!r}", file=sys.stderr)
+    if args.compact or os.environ.get("ASP_REGISTRY_COMPACT"):
+        return DEFAULT_BUDGET
+    return None
+
+def add_arguments(parser):
+    parser.add_argument("--compact", action="store_true", help="Emit a dense one-line-per-skill registry")
+    parser.add_argument("--budget", type=int, help="Character budget for the compact registry (implies --compact)")
+    parser.add_argument("--budget-tokens", type=int, help="Token budget for the compact registry (implies --compact)")
+
+def recent_usage(log_path=LOG_PATH):
+    """Count calls per skill in the most recent part of the skill-call log."""
+    counts = {}
+    try:
+        with open(log_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(size - USAGE_TAIL_BYTES, 0))
+            if size > USAGE_TAIL_BYTES:
+                f.readline()  # skip the partial first line
+            for line in f:
+                try:
+                    skill = json.loads(line).get("skill")
+                except ValueError:
+                    continue
+                if skill:
+                    counts[skill] = counts.get(skill, 0) + 1
+    except OSError:
+        pass
+    return counts
+
+def _first_sentence(text):
+    return re.split(r'(?<=\.)\s', text.strip(), maxsplit=1)[0]
+
+def _truncate(text, limit):
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 1].rsplit(" ", 1)[0].rstrip(" ,;:")
+    return cut + "…"
+
+def format_compact(skills, budget, usage=None, key="name"):
+    """Return registry lines that fit `budget` characters.
+
+    Every ranked skill gets at least its name; descriptions (first sentence,
+    then the full text) are granted in rank order and truncated once the
+    budget runs short.
+    Skills that do not fit even by name are summarised in a final line,
+    which is itself dropped if it would exceed the budget.
+    """
+    usage = usage or {}
+    ranked = sorted(skills, key=lambda s: (-usage.get(s.get("id", s[key]), 0), s[key]))
+
+    # Drop the lowest-ranked skills until every remaining name fits.
+    omitted = []
+    while True:
+        overflow = f"(+{len(omitted)} more skills not shown)" if omitted else ""
+        fixed = sum(len(s[key]) + 1 for s in ranked) + len(overflow)
+        if fixed <= budget or not ranked:
+            break
+        omitted.insert(0, ranked.pop())
+    if fixed > budget:
+        # Not even the summary line fits; the budget is a hard limit.
+        overflow = ""
+    remaining = budget - fixed
+
+    # First pass: the first sentence of each description, in rank order.
+    descriptions = []
+    for s in ranked:
+        description = _first_sentence(s.get("description", ""))
+        if description and remaining >= MIN_DESCRIPTION:
+            description = _truncate(description, remaining - 2)
+            remaining -= len(description) + 2
+        else:
+            description = ""
+        descriptions.append(description)
+
+    # Second pass: spend what is left on full descriptions, again in rank order.
+    for i, s in enumerate(ranked):
+        full = s.get("description", "").strip()
+        extra = len(full) - len(descriptions[i])
+        if descriptions[i] and extra > 0 and extra <= remaining:
+            descriptions[i] = full
+            remaining -= extra
+
+    lines = [f"{s[key]}: {d}" if d else s[key] for s, d in zip(ranked, descriptions)]
+    if overflow:
+        lines.append(overflow)
+    return lines
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Load skills from unpacked directories or packaged .skill archives in place.
+
+Python scripts inside an archive are run through zipimport, so nothing is
+written to disk. Other scripts (or Python scripts run with --materialize)
+are extracted on first use into a cache directory keyed by the archive's
+content digest, and reused until the archive changes.
+"""
+import os
+import sys
+import json
+import runpy
+import shutil
+import hashlib
+import zipfile
+import argparse
+import tempfile
+import subprocess
+
+SKILL_PATHS = ["./._/skills"]
+MANIFEST_NAME = ".skill-manifest.json"
+CACHE_DIR = os.environ.get("SKILL_CACHE_DIR", os.path.join(tempfile.gettempdir(), "jules-skills"))
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "logging")
+
+def find_skill(skill_id, skill_paths=SKILL_PATHS):
+    """Return the directory or .skill archive for `skill_id`.
+
+    A directory wins over an archive of the same name only if it holds a
+    SKILL.md, so a leftover empty directory does not hide a packaged skill.
+    """
+    for base_path in skill_paths:
+        skill_dir = os.path.join(base_path, skill_id)
+        if os.path.isfile(os.path.join(skill_dir, "SKILL.md")):
+            return skill_dir
+        archive = skill_dir + ".skill"
+        if zipfile.is_zipfile(archive):
+            return archive
+    return None
+
+def discover_skills(skill_paths=SKILL_PATHS):
+    """Yield (skill_id, path) for every skill under `skill_paths`, resolved like `find_skill`."""
+    for base_path in skill_paths:
+        if not os.path.isdir(base_path):
+            continue
+        names = sorted({item[:-len(".skill")] if item.endswith(".skill") else item for item in os.listdir(base_path)})
+        for skill_id in names:
+            skill_path = find_skill(skill_id, [base_path])
+            if skill_path:
+                yield skill_id, skill_path
+
+def read_archive_frontmatter(archive_path):
+    """Read the frontmatter of a packaged .skill without extracting it.
+
+    Opening the zip only reads its central directory; SKILL.md is then
+    streamed just far enough to reach the closing --- marker.
+    """
+    with zipfile.ZipFile(archive_path) as zf, zf.open("SKILL.md") as member:
+        lines = []
+        for raw in member:
+            line = raw.decode("utf-8")
+            lines.append(line)
+            if len(lines) == 1 and line.strip() != "---":
+                break
+            if len(lines) > 1 and line.strip() == "---":
+                break
+    return "".join(lines)
+
+def read_skill_md(skill_path):
+    if os.path.isdir(skill_path):
+        with open(os.path.join(skill_path, "SKILL.md"), "r") as f:
+            return f.read()
+    with zipfile.ZipFile(skill_path) as zf:
+        return zf.read("SKILL.md").decode("utf-8")
+
+def read_skill_frontmatter(skill_path):
+    """SKILL.md text for frontmatter parsing; archives are only read up to the closing ---."""
+    if os.path.isdir(skill_path):
+        return read_skill_md(skill_path)
+    return read_archive_frontmatter(skill_path)
+
+def archive_digest(archive_path):
+    """Content digest of an archive: the packaged manifest digest, else a hash of the file."""
+    with zipfile.ZipFile(archive_path) as zf:
+        try:
+            return json.loads(zf.read(MANIFEST_NAME).decode("utf-8"))["digest"]
+        except (KeyError, ValueError):
+            pass
+    digest = hashlib.sha256()
+    with open(archive_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def materialize(archive_path):
+    """Extract an archive once into the cache and return the directory."""
+    name = os.path.basename(archive_path)[:-len(".skill")]
+    target = os.path.join(CACHE_DIR, f"{name}-{archive_digest(archive_path)[:16]}")
+    if os.path.isdir(target):
+        return target
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=f".{name}-", dir=CACHE_DIR)
+    try:
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                path = zf.extract(info, staging)
+                # zipfile does not restore permissions; keep scripts executable.
+                mode = (info.external_attr >> 16) & 0o777
+                if mode and not info.is_dir():
+                    os.chmod(path, mode)
+        os.rename(staging, target)
+    except OSError:
+        # Another process won the race; use its copy.
+        shutil.rmtree(staging, ignore_errors=True)
+        if not os.path.isdir(target):
+            raise
+    return target
+
+def run_script(skill_path, script, args, force_materialize=False):
+    """Run `script` (relative to the skill, or a bare name under scripts/) and return its exit code."""
+    if "/" not in script:
+        script = f"scripts/{script}"
+    archive = not os.path.isdir(skill_path)
+    # Scripts inside an archive or the cache cannot find ._/logging relative to themselves.
+    os.environ.setdefault("SKILL_LOG_DIR", os.path.normpath(LOG_DIR))
+
+    if archive and script.endswith(".py") and not force_materialize:
+        with zipfile.ZipFile(skill_path) as zf:
+            if script not in zf.namelist():
+                print(f"Error: {script} not found in {skill_path}", file=sys.stderr)
+                return 1
+        # zipimport resolves the script and its sibling modules from the archive.
+        script_dir, module_file = os.path.split(script)
+        sys.path.insert(0, os.path.join(skill_path, script_dir))
+        sys.argv = [os.path.join(skill_path, script)] + list(args)
+        try:
+            runpy.run_module(module_file[:-len(".py")], run_name="__main__", alter_sys=True)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        return 0
+
+    base = materialize(skill_path) if archive else skill_path
+    path = os.path.join(base, script)
+    if not os.path.isfile(path):
+        print(f"Error: {script} not found in {skill_path}", file=sys.stderr)
+        return 1
+    if path.endswith(".py"):
+        cmd = [sys.executable, path]
+    elif path.endswith(".sh"):
+        cmd = ["bash", path]
+    else:
+        cmd = [path]
+    return subprocess.call(cmd + list(args))
+
+def main():
+    parser = argparse.ArgumentParser(description="Load skills from directories or .skill archives.")
+    parser.add_argument("--skill-path", action="append", dest="skill_paths", metavar="DIR",
+                        help=f"Directory to search for skills; repeatable (default: {', '.join(SKILL_PATHS)})")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    show_parser = subparsers.add_parser("show", help="Print a skill's SKILL.md")
+    show_parser.add_argument("skill")
+
+    path_parser = subparsers.add_parser("path", help="Print a filesystem path for the skill, extracting archives on demand")
+    path_parser.add_argument("skill")
+
+    run_parser = subparsers.add_parser("run", help="Run a skill script")
+    run_parser.add_argument("skill")
+    run_parser.add_argument("script", help="Script path inside the skill, or a bare name under scripts/")
+    run_parser.add_argument("--materialize", action="store_true", help="Extract the archive instead of using zipimport")
+    run_parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments passed to the script")
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return
+
+    skill_paths = args.skill_paths or SKILL_PATHS
+    skill_path = find_skill(args.skill, skill_paths)
+    if not skill_path:
+        print(f"Error: skill '{args.skill}' not found in {', '.join(skill_paths)}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "show":
+        print(read_skill_md(skill_path))
+    elif args.command == "path":
+        print(skill_path if os.path.isdir(skill_path) else materialize(skill_path))
+    elif args.command == "run":
+        sys.exit(run_script(skill_path, args.script, args.args, args.materialize))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Structured skill-call log.
+
+Every skill execution is recorded as one JSON line in `skill-calls.log`
+(skill, command, args, duration, status). Records are buffered in-process
+and appended with a single locked write, so concurrent skill processes never
+interleave lines. The log is rotated and gzip-compressed once it grows past
+SKILL_LOG_MAX_BYTES. `query` aggregates the log by streaming it line by line.
+"""
+import os
+import json
+import gzip
+import time
+import glob
+import atexit
+import random
+import sys
+import shutil
+import argparse
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, appends are still O_APPEND
+    fcntl = None
+
+def _env_int(name, default):
+    """Integer setting from the environment; a malformed value falls back to the default."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"Warning: ignoring non-numeric {name}={value!r}", file=sys.stderr)
+        return default
+
+LOG_PATH = os.environ.get("SKILL_CALL_LOG", os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill-calls.log"))
+MAX_BYTES = _env_int("SKILL_LOG_MAX_BYTES", 5 * 1024 * 1024)
+BACKUP_COUNT = _env_int("SKILL_LOG_BACKUPS", 5)
+BUFFER_BYTES = 64 * 1024
+FLUSH_INTERVAL = 5.0
+MAX_ARG_LENGTH = 200
+# Per-skill latency samples kept by `query`; beyond this a reservoir sample is used.
+MAX_SAMPLES = 10000
+
+class SkillLogger:
+    def __init__(self, path=LOG_PATH, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def log(self, skill, command, args=None, duration=None, status="success", **extra):
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "skill": skill,
+            "command": command,
+            "args": [str(a)[:MAX_ARG_LENGTH] for a in (args or [])],
+            "duration": round(duration, 6) if duration is not None else None,
+            "status": status,
+            "pid": os.getpid(),
+        }
+        record.update(extra)
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+        if self._buffered_bytes >= BUFFER_BYTES or time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    @contextmanager
+    def call(self, skill, command, args=None):
+        """Time the enclosed block and log it; exceptions and non-zero exits count as failures.
+
+        The yielded dict may be updated with extra fields (or a status) to record.
+        """
+        record = {"status": "success"}
+        start = time.perf_counter()
+        try:
+            yield record
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                record["status"] = "failure"
+                record.setdefault("error", f"exit code {e.code}")
+            raise
+        except BaseException as e:
+            record["status"] = "failure"
+            record.setdefault("error", f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            self.log(skill, command, args, time.perf_counter() - start, **record)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        rotated = None
+        while True:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                # Another process may have rotated the file while we waited for the lock.
+                try:
+                    if os.stat(self.path).st_ino != os.fstat(fd).st_ino:
+                        continue
+                except FileNotFoundError:
+                    continue
+                size = os.fstat(fd).st_size
+                if size and size + len(data) > self.max_bytes:
+                    rotated = f"{self.path}.{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{os.getpid()}"
+                    os.rename(self.path, rotated)
+                    continue
+                os.write(fd, data)
+                break
+            finally:
+                os.close(fd)
+
+        if rotated:
+            # Compress outside the lock so other writers are not blocked.
+            with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+            self._prune()
+
+    def _prune(self):
+        backups = sorted(glob.glob(f"{glob.escape(self.path)}.*.gz"))
+        for old in backups[:-self.backup_count] if self.backup_count else backups:
+            try:
+                os.remove(old)
+            except FileNotFoundError:
+                pass
+
+_logger = None
+
+def get_logger():
+    """Return the process-wide logger; its buffer is flushed at exit."""
+    global _logger
+    if _logger is None:
+        _logger = SkillLogger()
+        atexit.register(_logger.flush)
+    return _logger
+
+def log_call(skill, command, args=None, duration=None, status="success", **extra):
+    get_logger().log(skill, command, args, duration, status, **extra)
+
+def call(skill, command, args=None):
+    return get_logger().call(skill, command, args)
+
+def iter_records(path=LOG_PATH):
+    """Stream records from the rotated archives (oldest first) and the live log."""
+    for name in sorted(glob.glob(f"{glob.escape(path)}.*.gz")) + [path]:
+        opener = gzip.open if name.endswith(".gz") else open
+        try:
+            with opener(name, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            continue
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def aggregate(records, skill=None, since=None):
+    """Aggregate call counts, failure rates and latency percentiles per skill."""
+    rng = random.Random(0)
+    stats = {}
+    for r in records:
+        if skill and r.get("skill") != skill:
+            continue
+        if since and r.get("ts", "") < since:
+            continue
+        s = stats.setdefault(r.get("skill", "?"), {"calls": 0, "failures": 0, "samples": [], "seen": 0})
+        s["calls"] += 1
+        if r.get("status") != "success":
+            s["failures"] += 1
+        duration = r.get("duration")
+        if duration is None:
+            continue
+        s["seen"] += 1
+        if len(s["samples"]) < MAX_SAMPLES:
+            s["samples"].append(duration)
+        else:
+            j = rng.randrange(s["seen"])
+            if j < MAX_SAMPLES:
+                s["samples"][j] = duration
+
+    report = {}
+    for name, s in sorted(stats.items()):
+        samples = sorted(s["samples"])
+        report[name] = {
+            "calls": s["calls"],
+            "failures": s["failures"],
+            "failure_rate": round(s["failures"] / s["calls"], 4),
+            "p50": _percentile(samples, 50),
+            "p90": _percentile(samples, 90),
+            "p99": _percentile(samples, 99),
+        }
+    return report
+
+def _fmt(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Structured skill-call log.")
+    parser.add_argument("--log", default=LOG_PATH, help="Path to the skill-call log.")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    log_parser = subparsers.add_parser("log", help="Append a record (for shell-based skills)")
+    log_parser.add_argument("skill")
+    log_parser.add_argument("skill_command")
+    log_parser.add_argument("args", nargs="*")
+    log_parser.add_argument("--duration", type=float, help="Duration in seconds")
+    log_parser.add_argument("--status", default="success", help="success or failure")
+    log_parser.add_argument("--error", help="Error message")
+
+    query_parser = subparsers.add_parser("query", help="Aggregate calls, failure rates and latency per skill")
+    query_parser.add_argument("--skill", help="Only report this skill")
+    query_parser.add_argument("--since", help="Only include records at or after this ISO timestamp")
+    query_parser.add_argument("--format", choices=["text", "json"], default="text")
+
+    args = parser.parse_args()
+
+    if args.command == "log":
+        extra = {"error": args.error} if args.error else {}
+        logger = SkillLogger(args.log)
+        logger.log(args.skill, args.skill_command, args.args, args.duration, args.status, **extra)
+        logger.flush()
+    elif args.command == "query":
+        report = aggregate(iter_records(args.log), args.skill, args.since)
+        if args.format == "json":
+            print(json.dumps(report, indent=2))
+            return
+        print(f"{'skill':<24} {'calls':>7} {'fail%':>7} {'p50':>10} {'p90':>10} {'p99':>10}")
+        for name, s in report.items():
+            print(f"{name:<24} {s['calls']:>7} {s['failure_rate'] * 100:>6.1f}% "
+                  f"{_fmt(s['p50']):>10} {_fmt(s['p90']):>10} {_fmt(s['p99']):>10}")
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
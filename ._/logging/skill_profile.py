@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Execution profiler shared by the skill entry points.
+
+A script calls `start(skill)` as early as possible, wraps its imports,
+network calls, parsing and disk work in `phase(name)` blocks and runs its
+command inside `profiler.call(command, args)`. The per-invocation summary
+(start-up time, exclusive time per phase) is appended to the skill-call log.
+
+Set SKILL_PROFILE=cprofile, tracemalloc or all to additionally capture a
+cProfile dump (written to SKILL_PROFILE_DIR) or the peak traced memory.
+`report` aggregates the logged summaries into the slowest skills and phases.
+"""
+import os
+import json
+import time
+import argparse
+import threading
+from contextlib import contextmanager
+
+import skill_log
+
+PROFILE_MODES = {m.strip() for m in os.environ.get("SKILL_PROFILE", "").lower().split(",") if m.strip()}
+PROFILE_DIR = os.environ.get("SKILL_PROFILE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+
+def _process_age():
+    """Seconds since this process started, or None where /proc is unavailable.
+
+    Both uptime and the start time count from boot on the same clock, so the
+    age is exact to a clock tick (btime in /proc/stat is rounded to seconds).
+    """
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # The command name may contain spaces; fields resume after its ')'.
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - start_ticks / os.sysconf("SC_CLK_TCK"), 0.0)
+    except (OSError, ValueError, IndexError):
+        return None
+
+class Profiler:
+    def __init__(self, skill):
+        self.skill = skill
+        self.startup = _process_age()
+        self.started = time.perf_counter()
+        self.phases = {}
+        self._stack = []
+        self._cprofile = None
+        self._tracemalloc = None
+
+        if "cprofile" in PROFILE_MODES or "all" in PROFILE_MODES:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        if "tracemalloc" in PROFILE_MODES or "all" in PROFILE_MODES:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block. Nested phases pause their parent, so times are exclusive.
+
+        Only the main thread is timed; worker threads run their phases untimed.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self.phases[parent[0]] = self.phases.get(parent[0], 0.0) + now - parent[1]
+        entry = [name, now]
+        self._stack.append(entry)
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._stack.pop()
+            self.phases[name] = self.phases.get(name, 0.0) + now - entry[1]
+            if self._stack:
+                self._stack[-1][1] = now
+
+    def summary(self, command):
+        """Stop the optional tracers and return the fields appended to the log record."""
+        elapsed = time.perf_counter() - self.started
+        phases = {name: round(seconds, 6) for name, seconds in sorted(self.phases.items())}
+        phases["other"] = round(max(elapsed - sum(self.phases.values()), 0.0), 6)
+        if self.startup is not None:
+            phases["startup"] = round(self.startup, 6)
+        result = {"phases": phases}
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_DIR, f"{self.skill}-{command}-{int(time.time())}-{os.getpid()}.prof")
+            self._cprofile.dump_stats(path)
+            result["profile"] = path
+            self._cprofile = None
+        if self._tracemalloc is not None:
+            result["peak_memory"] = self._tracemalloc.get_traced_memory()[1]
+            self._tracemalloc.stop()
+            self._tracemalloc = None
+        return result
+
+    @contextmanager
+    def call(self, command, args=None):
+        """Run a command under skill_log.call and attach the profile summary to its record."""
+        with skill_log.call(self.skill, command, args) as record:
+            try:
+                yield record
+            finally:
+                record.update(self.summary(command))
+
+_profiler = None
+
+def start(skill):
+    """Start (or return) the process-wide profiler."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(skill)
+    return _profiler
+
+@contextmanager
+def phase(name):
+    """Time a block against the active profiler; a no-op when none was started."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name):
+        yield
+
+def report(records, since=None, top=10):
+    """Aggregate logged profile summaries per skill and per (skill, phase)."""
+    skills = {}
+    phases = {}
+    for r in records:
+        if "phases" not in r or (since and r.get("ts", "") < since):
+            continue
+        name = r.get("skill", "?")
+        s = skills.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0})
+        # Phases (including start-up and 'other') add up to the process wall time.
+        duration = sum(r["phases"].values())
+        s["calls"] += 1
+        s["total"] += duration
+        s["max"] = max(s["max"], duration)
+        for phase_name, seconds in r["phases"].items():
+            p = phases.setdefault((name, phase_name), {"calls": 0, "total": 0.0, "max": 0.0})
+            p["calls"] += 1
+            p["total"] += seconds
+            p["max"] = max(p["max"], seconds)
+
+    slowest_skills = sorted(
+        ({"skill": k, "calls": v["calls"], "mean": v["total"] / v["calls"], "max": v["max"]} for k, v in skills.items()),
+        key=lambda x: x["mean"], reverse=True)[:top]
+    slowest_phases = sorted(
+        ({"skill": k[0], "phase": k[1], "calls": v["calls"], "mean": v["total"] / v["calls"], "max": v["max"]}
+         for k, v in phases.items()),
+        key=lambda x: x["mean"], reverse=True)[:top]
+    return {"skills": slowest_skills, "phases": slowest_phases}
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the slowest skills and phases from the skill-call log.")
+    parser.add_argument("--log", default=skill_log.LOG_PATH, help="Path to the skill-call log.")
+    parser.add_argument("--since", help="Only include records at or after this ISO timestamp")
+    parser.add_argument("--top", type=int, default=10, help="Number of rows per table")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+
+    args = parser.parse_args()
+    result = report(skill_log.iter_records(args.log), args.since, args.top)
+
+    if args.format == "json":
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{'skill':<24} {'calls':>7} {'mean':>10} {'max':>10}")
+    for s in result["skills"]:
+        print(f"{s['skill']:<24} {s['calls']:>7} {s['mean'] * 1000:>8.1f}ms {s['max'] * 1000:>8.1f}ms")
+    print()
+    print(f"{'skill':<24} {'phase':<10} {'calls':>7} {'mean':>10} {'max':>10}")
+    for p in result["phases"]:
+        print(f"{p['skill']:<24} {p['phase']:<10} {p['calls']:>7} {p['mean'] * 1000:>8.1f}ms {p['max'] * 1000:>8.1f}ms")
+
+if __name__ == "__main__":
+    main()
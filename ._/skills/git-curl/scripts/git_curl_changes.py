@@ -0,0 +1,59 @@
+import difflib
+import sys
+
+from github_client import GitHubError, get_client, require_target, PROFILER, profiling
+
+def failure_message(repo_full, branch, path, error):
+    return (f"FAILED: Check GITHUB_PAT env (key still valid) and/or Path "
+            f"(https://api.github.com/repos/{repo_full}/contents/{path}?ref={branch}). [{error.code}]")
+
+def get_changes(client, repo_full, branch, path, raise_errors=False):
+    """Return the unified diff between the remote file and the local copy.
+
+    Returns None when the remote file could not be fetched, or re-raises the
+    GitHubError without printing anything if `raise_errors` is set.
+    """
+    try:
+        remote = client.get_raw_file(repo_full, branch, path)
+    except GitHubError as e:
+        if raise_errors:
+            raise
+        print(failure_message(repo_full, branch, path, e), file=sys.stderr)
+        return None
+
+    try:
+        with profiling.phase("io"), open(path, "r") as f:
+            local_lines = f.read().splitlines(keepends=True)
+    except FileNotFoundError:
+        local_lines = []
+    remote_lines = remote.decode("utf-8", "replace").splitlines(keepends=True)
+
+    diff = difflib.unified_diff(remote_lines, local_lines, fromfile=f"{branch}:{path}", tofile=path)
+    return "".join(line if line.endswith("\n") else line + "\n\\ No newline at end of file\n" for line in diff)
+
+def main():
+    if len(sys.argv) < 4 or not sys.argv[3]:
+        print(f"Usage: {sys.argv[0]} <repo> <branch> <file-path>")
+        sys.exit(1)
+
+    with PROFILER.call("changes", sys.argv[1:]) as record:
+        repo_full, branch = require_target(sys.argv[1], sys.argv[2])
+        path = sys.argv[3]
+        print(f"Check for Changes in repo {repo_full} branch {branch} file {path}")
+
+        try:
+            client = get_client()
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            record["error"] = str(e)
+            sys.exit(1)
+
+        diff = get_changes(client, repo_full, branch, path)
+        if diff is None:
+            record["error"] = "Could not fetch remote file"
+            sys.exit(1)
+        record["changed"] = bool(diff)
+        sys.stdout.write(diff)
+
+if __name__ == "__main__":
+    main()
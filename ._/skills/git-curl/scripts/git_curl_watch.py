@@ -0,0 +1,58 @@
+import sys
+import time
+
+from github_client import GitHubError, get_client, require_target, PROFILER
+from git_curl_changes import failure_message, get_changes
+
+def watch(client, repo_full, branch, path, interval_min=5, max_checks=10):
+    """Poll the remote file until it differs from the local copy.
+
+    All checks run in this process and share the client's warm connection.
+    Failed checks are retried silently; the last failure is reported once
+    if the watch times out.
+    """
+    last_error = None
+    for i in range(1, max_checks + 1):
+        try:
+            diff = get_changes(client, repo_full, branch, path, raise_errors=True)
+        except GitHubError as e:
+            diff = None
+            last_error = e
+        if diff:
+            print(f"Changes detected after {i * interval_min} minutes")
+            return True
+
+        # If this is not the final check, wait
+        if i < max_checks:
+            time.sleep(interval_min * 60)
+
+    # When we get here, the file hasn't changed within the allowed time
+    if last_error is not None:
+        print(failure_message(repo_full, branch, path, last_error), file=sys.stderr)
+    print(f"Timeout: no changes detected after {interval_min * max_checks} minutes")
+    return False
+
+def main():
+    if len(sys.argv) < 4:
+        print(f"Usage: {sys.argv[0]} <repo> <branch> <file_path> [interval_min] [max_checks]")
+        sys.exit(1)
+
+    with PROFILER.call("watch", sys.argv[1:]) as record:
+        repo_full, branch = require_target(sys.argv[1], sys.argv[2])
+        path = sys.argv[3]
+        interval_min = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+        max_checks = int(sys.argv[5]) if len(sys.argv) > 5 else 10
+
+        try:
+            client = get_client()
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            record["error"] = str(e)
+            sys.exit(1)
+
+        changed = watch(client, repo_full, branch, path, interval_min, max_checks)
+        record["changed"] = changed
+        sys.exit(0 if changed else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Shared GitHub REST client for the git-curl scripts.
+
+Keeps one keep-alive HTTPS connection per host, retries transient failures
+with exponential backoff and throttles itself using the X-RateLimit headers,
+so several operations in one process reuse a warm connection.
+"""
+import os
+import sys
+import json
+import time
+import random
+import re
+import subprocess
+import http.client
+from urllib.parse import urlsplit, urlencode, quote
+
+import profiling
+
+PROFILER = profiling.start("git-curl")
+
+API_HOST = "api.github.com"
+USER_AGENT = "jules-skills-git-curl"
+
+# Status codes worth retrying; 403/429 are only retried when rate limited.
+RETRY_STATUSES = {500, 502, 503, 504}
+RATE_LIMIT_STATUSES = {403, 429}
+REDIRECT_STATUSES = {301, 302, 307, 308}
+
+class GitHubError(Exception):
+    def __init__(self, code, body=""):
+        super().__init__(f"GitHub API returned {code}")
+        self.code = code
+        self.body = body
+
+class GitHubClient:
+    def __init__(self, token=None, max_retries=5, min_remaining=5, timeout=30):
+        self.token = token or os.environ.get("GITHUB_PAT")
+        if not self.token:
+            raise ValueError("GITHUB_PAT environment variable not set")
+        self.max_retries = max_retries
+        self.min_remaining = min_remaining
+        self.timeout = timeout
+        self._connections = {}
+        self.rate_remaining = None
+        self.rate_reset = None
+
+    def _connection(self, host):
+        conn = self._connections.get(host)
+        if conn is None:
+            conn = http.client.HTTPSConnection(host, timeout=self.timeout)
+            self._connections[host] = conn
+        return conn
+
+    def _drop_connection(self, host):
+        conn = self._connections.pop(host, None)
+        if conn is not None:
+            conn.close()
+
+    def close(self):
+        for host in list(self._connections):
+            self._drop_connection(host)
+
+    def _throttle(self):
+        """Sleep until the rate-limit window resets when the budget is nearly spent."""
+        if self.rate_remaining is None or self.rate_reset is None:
+            return
+        if self.rate_remaining > self.min_remaining:
+            return
+        wait_time = self.rate_reset - time.time() + 1
+        if wait_time > 0:
+            sys.stderr.write(f"Rate limit nearly exhausted ({self.rate_remaining} left). Waiting {wait_time:.0f}s for reset...\n")
+            time.sleep(wait_time)
+        self.rate_remaining = None
+
+    def _record_rate_limit(self, response):
+        remaining = response.getheader("X-RateLimit-Remaining")
+        reset = response.getheader("X-RateLimit-Reset")
+        if remaining is not None and remaining.isdigit():
+            self.rate_remaining = int(remaining)
+        if reset is not None and reset.isdigit():
+            self.rate_reset = int(reset)
+
+    def _retry_delay(self, response, retries):
+        retry_after = response.getheader("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+        if response.status in RATE_LIMIT_STATUSES and self.rate_remaining == 0 and self.rate_reset:
+            return max(self.rate_reset - time.time() + 1, 0)
+        return (2 ** retries) + random.random()
+
+    def request(self, method, url, params=None, body=None, accept="application/vnd.github.v3+json"):
+        """Execute a request and return (status, headers, body bytes).
+
+        `url` is either an API path ("/repos/...") or an absolute URL.
+        Raises GitHubError for non-2xx responses once retries are exhausted.
+        """
+        if url.startswith("/"):
+            url = f"https://{API_HOST}{url}"
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
+        headers = {
+            "Authorization": f"token {self.token}",
+            "Accept": accept,
+            "User-Agent": USER_AGENT,
+        }
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        retries = 0
+        redirects = 0
+        while True:
+            parts = urlsplit(url)
+            target = parts.path + (f"?{parts.query}" if parts.query else "")
+            self._throttle()
+            conn = self._connection(parts.netloc)
+            try:
+                send_headers = headers
+                if parts.netloc != API_HOST:
+                    # Never forward the token to hosts we were redirected to.
+                    send_headers = {k: v for k, v in headers.items() if k != "Authorization"}
+                with profiling.phase("network"):
+                    conn.request(method, target, body=payload, headers=send_headers)
+                    response = conn.getresponse()
+                    data = response.read()
+            except (http.client.HTTPException, ConnectionError, TimeoutError, OSError) as e:
+                # Stale keep-alive sockets surface here; reconnect and retry.
+                self._drop_connection(parts.netloc)
+                if retries >= self.max_retries:
+                    raise GitHubError(0, str(e))
+                wait_time = (2 ** retries) + random.random()
+                sys.stderr.write(f"Connection error ({e}). Retrying in {wait_time:.2f}s...\n")
+                time.sleep(wait_time)
+                retries += 1
+                continue
+
+            self._record_rate_limit(response)
+            if response.getheader("Connection", "").lower() == "close":
+                self._drop_connection(parts.netloc)
+
+            if response.status in REDIRECT_STATUSES and redirects < 5:
+                location = response.getheader("Location")
+                if location:
+                    url = location
+                    redirects += 1
+                    continue
+
+            rate_limited = response.status in RATE_LIMIT_STATUSES and (
+                response.status == 429 or self.rate_remaining == 0 or response.getheader("Retry-After")
+            )
+            if (response.status in RETRY_STATUSES or rate_limited) and retries < self.max_retries:
+                wait_time = self._retry_delay(response, retries)
+                sys.stderr.write(f"Transient error {response.status}. Retrying in {wait_time:.2f}s...\n")
+                time.sleep(wait_time)
+                retries += 1
+                continue
+
+            if not 200 <= response.status < 300:
+                raise GitHubError(response.status, data.decode("utf-8", "replace"))
+            return response.status, response.headers, data
+
+    def _contents_path(self, repo, path):
+        return f"/repos/{repo}/contents/{quote(path.lstrip('/'))}"
+
+    def get_file_info(self, repo, branch, path):
+        """Return the contents-API metadata for a file, or None if it does not exist."""
+        try:
+            _, _, data = self.request("GET", self._contents_path(repo, path), params={"ref": branch})
+        except GitHubError as e:
+            if e.code == 404:
+                return None
+            raise
+        with profiling.phase("parse"):
+            return json.loads(data.decode("utf-8"))
+
+    def get_raw_file(self, repo, branch, path):
+        """Return the raw bytes of a remote file."""
+        _, _, data = self.request("GET", self._contents_path(repo, path), params={"ref": branch},
+                                  accept="application/vnd.github.v3.raw")
+        return data
+
+    def put_file(self, repo, branch, path, content_b64, message, sha=None):
+        data = {
+            "message": message,
+            "content": content_b64,
+            "branch": branch
+        }
+        if sha:
+            data["sha"] = sha
+        status, _, body = self.request("PUT", self._contents_path(repo, path), body=data)
+        return status, json.loads(body.decode("utf-8")) if body else {}
+
+_client = None
+
+def get_client():
+    """Return the process-wide client so every command shares one warm connection."""
+    global _client
+    if _client is None:
+        _client = GitHubClient()
+    return _client
+
+def get_current_repo_info():
+    try:
+        remote_v = subprocess.check_output(["git", "remote", "-v"]).decode()
+        # Look for the origin fetch URL
+        match = re.search(r"origin\s+(?:https://github\.com/|git@github\.com:)([^/]+)/([^/\s]+?)(?:\.git)?\s", remote_v)
+        if match:
+            return f"{match.group(1)}/{match.group(2)}"
+    except Exception as e:
+        print(f"Error deriving repo info: {e}")
+    return None
+
+def get_current_branch():
+    try:
+        return subprocess.check_output(["git", "branch", "--show-current"]).decode().strip()
+    except Exception as e:
+        print(f"Error deriving branch info: {e}")
+    return None
+
+def resolve_target(repo_arg, branch_arg):
+    """Resolve `.`/empty repo and branch arguments against the local checkout."""
+    repo_full = get_current_repo_info() if repo_arg in (".", "", None) else repo_arg
+    branch = get_current_branch() if branch_arg in (".", "", None) else branch_arg
+    return repo_full, branch
+
+def require_target(repo_arg, branch_arg):
+    """Resolve the target like `resolve_target`, exiting if it is missing or malformed."""
+    repo_full, branch = resolve_target(repo_arg, branch_arg)
+
+    if not repo_full or not branch:
+        print("Could not determine repo or branch")
+        sys.exit(1)
+
+    if "/" not in repo_full:
+        print(f"Invalid repo format: {repo_full}. Expected 'owner/repo'")
+        sys.exit(1)
+
+    return repo_full, branch
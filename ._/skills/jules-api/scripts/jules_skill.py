@@ -1,16 +1,104 @@
 #!/usr/bin/env python3
-import requests
 import os
 import json
 import sys
 import argparse
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import profiling
+
+PROFILER = profiling.start("jules-api")
+with PROFILER.phase("import"):
+    import requests
 
 API_BASE_URL = "https://jules.googleapis.com/v1alpha"
 
+# Keys shared by every activity; the remaining key names the activity type.
+ACTIVITY_COMMON_KEYS = {"name", "id", "description", "createTime", "originator", "artifacts"}
+EXTRACT_FIELDS = ["id", "type", "originator", "time", "text"]
+
+INVENTORY_SNAPSHOT = ".jules-inventory.json"
+SNAPSHOT_VERSION = 1
+
+def activity_type(activity):
+    return next((key for key in activity if key not in ACTIVITY_COMMON_KEYS), None)
+
+def activity_text(activity):
+    """Normalized text of an activity, following the SKILL.md message schema."""
+    if "userMessage" in activity:
+        return activity["userMessage"].get("userMessage")
+    if "agentMessaged" in activity:
+        return activity["agentMessaged"].get("agentMessage")
+    if "planGenerated" in activity:
+        steps = activity["planGenerated"].get("plan", {}).get("steps", [])
+        return "\n".join(step.get("title", "") for step in steps)
+    if "progressUpdated" in activity:
+        progress = activity["progressUpdated"]
+        return "\n".join(part for part in (progress.get("title"), progress.get("description")) if part)
+    if "sessionFailed" in activity:
+        return activity["sessionFailed"].get("reason")
+    return activity.get("description")
+
+def project_activity(activity, fields):
+    """Reduce an activity to the requested fields ('type', 'time' and 'text' are derived)."""
+    projected = {}
+    for field in fields:
+        if field == "type":
+            projected["type"] = activity_type(activity)
+        elif field == "time":
+            projected["time"] = activity.get("createTime")
+        elif field == "text":
+            projected["text"] = activity_text(activity)
+        elif field in activity:
+            projected[field] = activity[field]
+    return projected
+
+def session_fingerprint(session):
+    """Change marker for a session: its updateTime, else the listed payload itself."""
+    return session.get("updateTime") or json.dumps(session, sort_keys=True)
+
+def load_snapshot(path):
+    """Return the session entries of an inventory snapshot, or {} if missing or incompatible."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return data.get("sessions", {})
+
+def save_snapshot(path, entries):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({
+            "version": SNAPSHOT_VERSION,
+            "updated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "sessions": entries
+        }, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 class JulesAPI:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, rate=None):
         self.api_key = api_key or os.environ.get("JULES_API_KEY")
         if not self.api_key:
             raise ValueError("JULES_API_KEY not found in environment or arguments.")
@@ -18,12 +106,16 @@ class JulesAPI:
             "x-goog-api-key": self.api_key,
             "Content-Type": "application/json"
         }
+        self.limiter = RateLimiter(rate) if rate else None
 
     def request_with_retry(self, method, url, max_retries=5, **kwargs):
         """Execute a request with exponential backoff for transient errors."""
         retries = 0
         while retries < max_retries:
-            response = requests.request(method, url, headers=self.headers, **kwargs)
+            if self.limiter:
+                self.limiter.wait()
+            with PROFILER.phase("network"):
+                response = requests.request(method, url, headers=self.headers, **kwargs)
             if response.status_code in [429, 503]:
                 wait_time = (2 ** retries) + random.random()
                 sys.stderr.write(f"Transient error {response.status_code}. Retrying in {wait_time:.2f}s...\n")
@@ -35,7 +127,8 @@ class JulesAPI:
                 response.raise_for_status()
                 if response.status_code == 204:
                     return {"status": "success"}
-                return response.json()
+                with PROFILER.phase("parse"):
+                    return response.json()
             except requests.exceptions.HTTPError as e:
                 return {
                     "error": str(e),
@@ -49,18 +142,122 @@ class JulesAPI:
         url = f"{API_BASE_URL}/sources"
         return self.request_with_retry("GET", url)
 
-    def list_sessions(self, page_size=10):
+    def list_sessions(self, page_size=10, page_token=None):
         url = f"{API_BASE_URL}/sessions"
         params = {"pageSize": page_size}
+        if page_token:
+            params["pageToken"] = page_token
         return self.request_with_retry("GET", url, params=params)
 
+    def list_all_sessions(self, page_size=100):
+        """Automatically paginates through all sessions."""
+        all_sessions = []
+        page_token = None
+        while True:
+            data = self.list_sessions(page_size, page_token)
+            if "error" in data:
+                return data
+
+            all_sessions.extend(data.get("sessions", []))
+
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                break
+        return {"sessions": all_sessions}
+
     def get_session(self, session_id):
         if not session_id.startswith("sessions/"):
             session_id = f"sessions/{session_id}"
         url = f"{API_BASE_URL}/{session_id}"
         return self.request_with_retry("GET", url)
 
-    def _filter_activities(self, activities, originator=None, activity_type=None):
+    def _hydrate_session(self, name, include_latest=False):
+        """Fetch full details (and optionally the latest activity) for one session."""
+        session = self.get_session(name)
+        if "error" in session:
+            return session
+        entry = {"session": session}
+        if include_latest:
+            latest = self.get_latest_activities(name, count=1, fields=EXTRACT_FIELDS)
+            if "error" in latest:
+                return latest
+            activities = latest.get("activities")
+            entry["latestActivity"] = activities[-1] if activities else None
+        return entry
+
+    def inventory(self, snapshot_path=INVENTORY_SNAPSHOT, include_latest=False, max_workers=8, refresh=False):
+        """
+        List every session with full details, reusing a local snapshot.
+
+        Sessions whose listed updateTime matches the snapshot are taken from it;
+        new or changed ones are hydrated concurrently (bounded by `max_workers`
+        and the client's rate limiter). Sessions that fail to hydrate keep their
+        previous snapshot entry and are retried on the next run.
+        """
+        listing = self.list_all_sessions()
+        if "error" in listing:
+            return listing
+
+        previous = load_snapshot(snapshot_path) if snapshot_path and not refresh else {}
+        entries = {}
+        stale = {}
+        for summary in listing["sessions"]:
+            name = summary.get("name")
+            if not name:
+                continue
+            fingerprint = session_fingerprint(summary)
+            cached = previous.get(name)
+            if (cached and cached.get("fingerprint") == fingerprint
+                    and (not include_latest or "latestActivity" in cached)):
+                entries[name] = cached
+            else:
+                stale[name] = fingerprint
+        reused = len(entries)
+
+        errors = []
+        if stale:
+            with PROFILER.phase("network"), ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {pool.submit(self._hydrate_session, name, include_latest): name for name in stale}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    result = future.result()
+                    if "error" in result:
+                        errors.append({"name": name, "error": result["error"], "status_code": result.get("status_code")})
+                        if name in previous:
+                            entries[name] = previous[name]
+                        continue
+                    result["fingerprint"] = stale[name]
+                    entries[name] = result
+
+        # Keep the listing order (most recent first) in both snapshot and output.
+        ordered = {s["name"]: entries[s["name"]] for s in listing["sessions"] if s.get("name") in entries}
+        if snapshot_path:
+            with PROFILER.phase("io"):
+                save_snapshot(snapshot_path, ordered)
+
+        sessions = []
+        for entry in ordered.values():
+            session = dict(entry["session"])
+            if include_latest:
+                session["latestActivity"] = entry.get("latestActivity")
+            sessions.append(session)
+
+        result = {
+            "sessions": sessions,
+            "stats": {
+                "total": len(sessions),
+                "hydrated": len(stale) - len(errors),
+                "reused": reused,
+                "removed": len(set(previous) - set(ordered)),
+                "failed": len(errors)
+            }
+        }
+        if errors:
+            result["errors"] = errors
+        return result
+
+    def _filter_activities(self, activities, originator=None, activity_type=None, fields=None):
+        """Filter a page of activities and, if `fields` is given, project each kept one."""
         filtered = []
         for act in activities:
             if originator and act.get("originator") != originator:
@@ -68,10 +265,10 @@ class JulesAPI:
             if activity_type:
                 if activity_type not in act:
                     continue
-            filtered.append(act)
+            filtered.append(project_activity(act, fields) if fields else act)
         return filtered
 
-    def list_activities(self, session_id, page_size=30, page_token=None, originator=None, activity_type=None):
+    def list_activities(self, session_id, page_size=30, page_token=None, originator=None, activity_type=None, fields=None):
         if not session_id.startswith("sessions/"):
             session_id = f"sessions/{session_id}"
         url = f"{API_BASE_URL}/{session_id}/activities"
@@ -89,7 +286,7 @@ class JulesAPI:
                 return data
 
             activities = data.get("activities", [])
-            filtered = self._filter_activities(activities, originator, activity_type)
+            filtered = self._filter_activities(activities, originator, activity_type, fields)
             all_filtered.extend(filtered)
 
             current_token = data.get("nextPageToken")
@@ -101,13 +298,13 @@ class JulesAPI:
             "nextPageToken": current_token
         }
 
-    def list_all_activities(self, session_id, originator=None, activity_type=None):
+    def list_all_activities(self, session_id, originator=None, activity_type=None, fields=None):
         """Automatically paginates through all activities."""
         all_activities = []
         page_token = None
         while True:
             # Use a large page size for efficiency
-            data = self.list_activities(session_id, page_size=100, page_token=page_token, originator=originator, activity_type=activity_type)
+            data = self.list_activities(session_id, page_size=100, page_token=page_token, originator=originator, activity_type=activity_type, fields=fields)
             if "error" in data:
                 return data
 
@@ -119,7 +316,7 @@ class JulesAPI:
                 break
         return {"activities": all_activities}
 
-    def get_latest_activities(self, session_id, count=10, originator=None, activity_type=None):
+    def get_latest_activities(self, session_id, count=10, originator=None, activity_type=None, fields=None):
         """Optimized retrieval of the most recent activities by jumping through pages to the end."""
         page_token = None
         last_matching_activities = []
@@ -137,7 +334,7 @@ class JulesAPI:
                 return data
 
             activities = data.get("activities", [])
-            filtered = self._filter_activities(activities, originator, activity_type)
+            filtered = self._filter_activities(activities, originator, activity_type, fields)
 
             if filtered:
                 last_matching_activities.extend(filtered)
@@ -150,11 +347,12 @@ class JulesAPI:
 
         return {"activities": last_matching_activities}
 
-    def poll_new_activities(self, session_id, last_processed_id=None, last_page_token=None, originator=None, activity_type=None):
+    def poll_new_activities(self, session_id, last_processed_id=None, last_page_token=None, originator=None, activity_type=None, fields=None):
         """
         Poll only new activities since last_processed_id or from last_page_token.
         """
         new_activities = []
+        last_new_id = None
         current_token = last_page_token
         latest_valid_token = last_page_token
 
@@ -171,12 +369,17 @@ class JulesAPI:
                 return data
 
             activities = data.get("activities", [])
+            page_new = []
             for act in activities:
                 if not found_last_id:
                     if act.get("id") == last_processed_id:
                         found_last_id = True
                     continue
-                new_activities.append(act)
+                page_new.append(act)
+            if page_new:
+                last_new_id = page_new[-1].get("id")
+                # Filter and project per page so full payloads are not kept around.
+                new_activities.extend(self._filter_activities(page_new, originator, activity_type, fields))
 
             next_token = data.get("nextPageToken")
             if next_token:
@@ -185,20 +388,18 @@ class JulesAPI:
             else:
                 break
 
-        filtered = self._filter_activities(new_activities, originator, activity_type)
-
         return {
-            "activities": filtered,
+            "activities": new_activities,
             "lastPageToken": latest_valid_token,
-            "lastId": new_activities[-1].get("id") if new_activities else last_processed_id
+            "lastId": last_new_id or last_processed_id
         }
 
-    def wait_for(self, session_id, originator=None, activity_type=None, timeout=300, poll_interval=5):
+    def wait_for(self, session_id, originator=None, activity_type=None, timeout=300, poll_interval=5, fields=None):
         """Blocks until an activity matching the filter appears, or timeout is reached."""
         start_time = time.time()
 
         # Determine the starting point (the current end)
-        tail = self.get_latest_activities(session_id, count=1)
+        tail = self.get_latest_activities(session_id, count=1, fields=["id"])
         last_id = None
         if tail.get("activities"):
             last_id = tail["activities"][-1].get("id")
@@ -221,7 +422,7 @@ class JulesAPI:
         sys.stderr.write(f"Waiting for activity (originator={originator}, type={activity_type}) in {session_id}...\n")
 
         while time.time() - start_time < timeout:
-            result = self.poll_new_activities(session_id, last_processed_id=last_id, last_page_token=last_token, originator=originator, activity_type=activity_type)
+            result = self.poll_new_activities(session_id, last_processed_id=last_id, last_page_token=last_token, originator=originator, activity_type=activity_type, fields=fields)
             if "error" in result:
                 return result
 
@@ -251,6 +452,15 @@ def main():
 
     list_sessions_parser = subparsers.add_parser("list_sessions", help="List sessions")
     list_sessions_parser.add_argument("--page_size", type=int, default=10, help="Number of sessions to list")
+    list_sessions_parser.add_argument("--page_token", help="Token for the next page")
+
+    inventory_parser = subparsers.add_parser("inventory", help="List all sessions with details, refreshing a local snapshot")
+    inventory_parser.add_argument("--latest", action="store_true", help="Include each session's latest activity (extracted fields)")
+    inventory_parser.add_argument("--snapshot", default=INVENTORY_SNAPSHOT, help=f"Snapshot file to refresh incrementally (default: {INVENTORY_SNAPSHOT})")
+    inventory_parser.add_argument("--no_snapshot", action="store_true", help="Neither read nor write a snapshot")
+    inventory_parser.add_argument("--refresh", action="store_true", help="Ignore the snapshot and hydrate every session")
+    inventory_parser.add_argument("--workers", type=int, default=8, help="Concurrent detail requests")
+    inventory_parser.add_argument("--rate", type=float, default=5.0, help="Maximum requests per second")
 
     get_session_parser = subparsers.add_parser("get_session", help="Get session details")
     get_session_parser.add_argument("session_id", nargs='?', help="Session ID or full name")
@@ -287,72 +497,88 @@ def main():
     wait_parser.add_argument("--type", help="Filter by activity type")
     wait_parser.add_argument("--timeout", type=int, default=300, help="Timeout in seconds")
 
+    for activity_parser in (list_activities_parser, list_all_parser, latest_parser, poll_parser, wait_parser):
+        activity_parser.add_argument("--fields", help="Comma-separated fields to keep per activity (derived: type, time, text)")
+        activity_parser.add_argument("--extract", action="store_true", help=f"Shorthand for --fields {','.join(EXTRACT_FIELDS)}")
+
     send_message_parser = subparsers.add_parser("send_message", help="Send a message to a session")
     send_message_parser.add_argument("session_id", nargs='?', help="Session ID or full name")
     send_message_parser.add_argument("prompt", help="Message text")
 
     args = parser.parse_args()
 
+    if args.command == "inventory":
+        if args.workers < 1:
+            inventory_parser.error("--workers must be at least 1")
+        if args.rate <= 0:
+            inventory_parser.error("--rate must be greater than 0")
+
     # Determine session_id from flags, positional, or environment
     session_id = args.session_id or (getattr(args, 'session_id', None) if hasattr(args, 'session_id') else None) or os.environ.get("JULES_SESSION_ID")
 
-    try:
-        api = JulesAPI()
-    except ValueError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-
-    if args.command == "list_sources":
-        print(json.dumps(api.list_sources(), indent=2))
-    elif args.command == "list_sessions":
-        print(json.dumps(api.list_sessions(args.page_size), indent=2))
-    elif args.command == "get_session":
-        sid = args.session_id or session_id
-        if not sid:
-            print("Error: session_id is required.")
-            sys.exit(1)
-        print(json.dumps(api.get_session(sid), indent=2))
-    elif args.command == "list_activities":
-        sid = args.session_id or session_id
-        if not sid:
-            print("Error: session_id is required.")
+    if not args.command:
+        parser.print_help()
+        return
+
+    fields = None
+    if getattr(args, "fields", None):
+        fields = [f.strip() for f in args.fields.split(",") if f.strip()]
+    elif getattr(args, "extract", False):
+        fields = EXTRACT_FIELDS
+
+    with PROFILER.call(args.command, sys.argv[1:]) as record:
+        try:
+            api = JulesAPI(rate=getattr(args, "rate", None))
+        except ValueError as e:
+            print(f"Error: {e}")
+            record["error"] = str(e)
             sys.exit(1)
-        if args.tail:
-            print(json.dumps(api.get_latest_activities(sid, args.page_size, args.originator, args.type), indent=2))
+
+        if args.command in ("list_sources", "list_sessions", "inventory"):
+            sid = None
         else:
-            print(json.dumps(api.list_activities(sid, args.page_size, args.page_token, args.originator, args.type), indent=2))
-    elif args.command == "list_all_activities":
-        sid = args.session_id or session_id
-        if not sid:
-            print("Error: session_id is required.")
-            sys.exit(1)
-        print(json.dumps(api.list_all_activities(sid, args.originator, args.type), indent=2))
-    elif args.command == "get_latest_activities":
-        sid = args.session_id or session_id
-        if not sid:
-            print("Error: session_id is required.")
-            sys.exit(1)
-        print(json.dumps(api.get_latest_activities(sid, args.count, args.originator, args.type), indent=2))
-    elif args.command == "poll_new":
-        sid = args.session_id or session_id
-        if not sid:
-            print("Error: session_id is required.")
-            sys.exit(1)
-        print(json.dumps(api.poll_new_activities(sid, args.last_id, args.last_token, args.originator, args.type), indent=2))
-    elif args.command == "wait_for":
-        sid = args.session_id or session_id
-        if not sid:
-            print("Error: session_id is required.")
-            sys.exit(1)
-        print(json.dumps(api.wait_for(sid, args.originator, args.type, args.timeout), indent=2))
-    elif args.command == "send_message":
-        sid = args.session_id or session_id
-        if not sid:
-            print("Error: session_id is required.")
-            sys.exit(1)
-        print(json.dumps(api.send_message(sid, args.prompt), indent=2))
-    else:
-        parser.print_help()
+            sid = args.session_id or session_id
+            if not sid:
+                print("Error: session_id is required.")
+                sys.exit(1)
+
+        if args.command == "list_sources":
+            result = api.list_sources()
+        elif args.command == "list_sessions":
+            result = api.list_sessions(args.page_size, args.page_token)
+        elif args.command == "inventory":
+            snapshot = None if args.no_snapshot else args.snapshot
+            result = api.inventory(snapshot, args.latest, args.workers, args.refresh)
+        elif args.command == "get_session":
+            result = api.get_session(sid)
+        elif args.command == "list_activities":
+            if args.tail:
+                result = api.get_latest_activities(sid, args.page_size, args.originator, args.type, fields)
+            else:
+                result = api.list_activities(sid, args.page_size, args.page_token, args.originator, args.type, fields)
+        elif args.command == "list_all_activities":
+            result = api.list_all_activities(sid, args.originator, args.type, fields)
+        elif args.command == "get_latest_activities":
+            result = api.get_latest_activities(sid, args.count, args.originator, args.type, fields)
+        elif args.command == "poll_new":
+            result = api.poll_new_activities(sid, args.last_id, args.last_token, args.originator, args.type, fields)
+        elif args.command == "wait_for":
+            result = api.wait_for(sid, args.originator, args.type, args.timeout, fields=fields)
+        elif args.command == "send_message":
+            result = api.send_message(sid, args.prompt)
+
+        if "error" in result:
+            record["status"] = "failure"
+            record["error"] = result["error"]
+            record["status_code"] = result.get("status_code")
+        elif result.get("errors"):
+            record["status"] = "failure"
+            record["error"] = f"{len(result['errors'])} session(s) failed to hydrate"
+        if fields:
+            # Projected output is meant for piping; skip the indentation.
+            print(json.dumps(result, ensure_ascii=False, separators=(",", ":")))
+        else:
+            print(json.dumps(result, indent=2))
 
 if __name__ == "__main__":
     main()
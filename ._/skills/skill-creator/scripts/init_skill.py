@@ -3,6 +3,10 @@ import os
 import sys
 import argparse
 
+import profiling
+
+PROFILER = profiling.start("skill-creator")
+
 def init_skill(name, path):
     skill_dir = os.path.join(path, name)
     if os.path.exists(skill_dir):
@@ -32,7 +36,7 @@ Describe how to use this skill.
 - `assets/`: Templates and static resources.
 """
 
-    with open(os.path.join(skill_dir, "SKILL.md"), 'w') as f:
+    with profiling.phase("io"), open(os.path.join(skill_dir, "SKILL.md"), 'w') as f:
         f.write(skill_md_content)
 
     print(f"Skill '{name}' initialized at {skill_dir}")
@@ -43,7 +47,8 @@ def main():
     parser.add_argument("--path", default="._/skills", help="The directory where the skill will be created.")
 
     args = parser.parse_args()
-    init_skill(args.name, args.path)
+    with PROFILER.call("init", sys.argv[1:]):
+        init_skill(args.name, args.path)
 
 if __name__ == "__main__":
     main()
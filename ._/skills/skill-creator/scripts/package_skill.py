@@ -1,18 +1,145 @@
 #!/usr/bin/env python3
 import os
 import sys
+import json
+import stat
+import struct
+import hashlib
+import zlib
+import argparse
 import zipfile
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
-def package_skill(skill_path, output_dir):
-    # Validate first
-    validate_script = os.path.join(os.path.dirname(__file__), "validate_skill.py")
-    result = subprocess.run([sys.executable, validate_script, skill_path], capture_output=True, text=True)
+import profiling
+from validate_skill import validate_skill
 
-    if result.returncode != 0:
+PROFILER = profiling.start("skill-creator")
+
+MANIFEST_NAME = ".skill-manifest.json"
+MANIFEST_VERSION = 1
+
+# Formats that are already compressed; deflating them again only costs time.
+STORED_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".skill", ".whl", ".jar",
+    ".mp3", ".mp4", ".ogg", ".webm", ".woff", ".woff2", ".pdf",
+}
+EXCLUDED_DIRS = {"__pycache__", ".git"}
+EXCLUDED_SUFFIXES = (".pyc", ".pyo")
+# Tool output and caches that may be left inside a skill directory.
+EXCLUDED_NAMES = {".validate-cache.json", ".jules-inventory.json", ".DS_Store"}
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+# Every member gets the same timestamp (1980-01-01 00:00:00 in DOS format)
+# so identical inputs produce byte-identical archives.
+DOS_TIME = 0
+DOS_DATE = (1 << 5) | 1
+
+def collect_files(skill_path, exclude=()):
+    """Return sorted (arcname, file_path) pairs for every file in the skill."""
+    exclude = {os.path.abspath(p) for p in exclude}
+    files = []
+    for root, dirs, names in os.walk(skill_path):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        for name in names:
+            file_path = os.path.join(root, name)
+            if (name in EXCLUDED_NAMES or name.endswith(EXCLUDED_SUFFIXES)
+                    or os.path.abspath(file_path) in exclude):
+                continue
+            arcname = os.path.relpath(file_path, skill_path).replace(os.sep, "/")
+            if arcname == MANIFEST_NAME:
+                continue
+            files.append((arcname, file_path))
+    files.sort()
+    return files
+
+def read_member(arcname, file_path):
+    with open(file_path, "rb") as f:
+        data = f.read()
+    executable = os.stat(file_path).st_mode & stat.S_IXUSR
+    mode = 0o755 if executable else 0o644
+    return {
+        "arcname": arcname,
+        "data": data,
+        "mode": mode,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+def build_manifest(members):
+    files = {m["arcname"]: {"sha256": m["sha256"], "mode": oct(m["mode"])} for m in members}
+    digest = hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest()
+    return {"version": MANIFEST_VERSION, "digest": digest, "files": files}
+
+def read_existing_manifest(zip_path):
+    """Return the manifest stored in an existing package, or None."""
+    try:
+        with zipfile.ZipFile(zip_path) as zipf:
+            return json.loads(zipf.read(MANIFEST_NAME).decode("utf-8"))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+def compress_member(member):
+    data = member["data"]
+    method = ZIP_STORED
+    payload = data
+    ext = os.path.splitext(member["arcname"])[1].lower()
+    if data and ext not in STORED_EXTENSIONS:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+        if len(deflated) < len(data):
+            method = ZIP_DEFLATED
+            payload = deflated
+    return {
+        "name": member["arcname"].encode("utf-8"),
+        "method": method,
+        "crc": zlib.crc32(data),
+        "size": len(data),
+        "payload": payload,
+        "mode": member["mode"],
+    }
+
+def write_archive(zip_path, entries):
+    """Write pre-compressed entries as a deterministic zip file.
+
+    zipfile cannot accept data that is already deflated, so the (small)
+    container format is written directly. Zip64 is not needed for skills.
+    """
+    if len(entries) > 0xFFFF:
+        raise ValueError("Too many files for a .skill package")
+
+    tmp_path = zip_path + ".tmp"
+    central = []
+    offset = 0
+    with open(tmp_path, "wb") as f:
+        for e in entries:
+            flags = 0 if e["name"].isascii() else 0x800
+            if offset > 0xFFFFFFFF or e["size"] > 0xFFFFFFFF:
+                raise ValueError("File too large for a .skill package")
+            header = struct.pack(
+                "<4sHHHHHLLLHH", b"PK\x03\x04", 20, flags, e["method"], DOS_TIME, DOS_DATE,
+                e["crc"], len(e["payload"]), e["size"], len(e["name"]), 0)
+            f.write(header + e["name"])
+            f.write(e["payload"])
+            central.append(struct.pack(
+                "<4sHHHHHHLLLHHHHHLL", b"PK\x01\x02", (3 << 8) | 20, 20, flags, e["method"],
+                DOS_TIME, DOS_DATE, e["crc"], len(e["payload"]), e["size"], len(e["name"]),
+                0, 0, 0, 0, (stat.S_IFREG | e["mode"]) << 16, offset) + e["name"])
+            offset += len(header) + len(e["name"]) + len(e["payload"])
+
+        central_dir = b"".join(central)
+        f.write(central_dir)
+        f.write(struct.pack("<4sHHHHLLH", b"PK\x05\x06", 0, 0, len(entries), len(entries),
+                            len(central_dir), offset, 0))
+    os.replace(tmp_path, zip_path)
+
+def package_skill(skill_path, output_dir, force=False, jobs=None):
+    # Validate first (in-process)
+    errors = validate_skill(skill_path)
+    if errors:
         print("Validation failed:")
-        print(result.stdout)
-        print(result.stderr)
+        for error in errors:
+            print(error)
         sys.exit(1)
 
     skill_name = os.path.basename(os.path.normpath(skill_path))
@@ -21,24 +148,39 @@ def package_skill(skill_path, output_dir):
 
     zip_path = os.path.join(output_dir, f"{skill_name}.skill")
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(skill_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, skill_path)
-                zipf.write(file_path, arcname)
+    files = collect_files(skill_path, exclude=[zip_path, zip_path + ".tmp"])
+    with profiling.phase("io"), ThreadPoolExecutor(max_workers=jobs) as pool:
+        members = list(pool.map(lambda item: read_member(*item), files))
+    manifest = build_manifest(members)
+
+    if not force and os.path.exists(zip_path):
+        existing = read_existing_manifest(zip_path)
+        if existing and existing.get("digest") == manifest["digest"]:
+            print(f"Skill package at {zip_path} is up to date.")
+            return zip_path
 
+    manifest_data = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+    members.append({"arcname": MANIFEST_NAME, "data": manifest_data, "mode": 0o644})
+
+    # zlib releases the GIL, so threads compress files in parallel.
+    with profiling.phase("compress"), ThreadPoolExecutor(max_workers=jobs) as pool:
+        entries = list(pool.map(compress_member, members))
+
+    with profiling.phase("io"):
+        write_archive(zip_path, entries)
     print(f"Skill packaged successfully at {zip_path}")
+    return zip_path
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: package_skill.py <path/to/skill-folder> [output-directory]")
-        sys.exit(1)
-
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else "."
+    parser = argparse.ArgumentParser(description="Validate and package a skill into a .skill archive.")
+    parser.add_argument("skill_path", help="Path to the skill folder.")
+    parser.add_argument("output_dir", nargs="?", default=".", help="Directory for the .skill file.")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the manifest is unchanged.")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of parallel compression workers.")
 
-    package_skill(skill_path, output_dir)
+    args = parser.parse_args()
+    with PROFILER.call("package", sys.argv[1:]):
+        package_skill(args.skill_path, args.output_dir, args.force, args.jobs)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,42 @@
+"""Optional hook into the shared skill-call logger and profiler.
+
+The logger lives in ._/logging at the repository root (or SKILL_LOG_DIR).
+A skill also runs from packaged archives and from workspaces without that
+directory; there `start` returns a no-op profiler, so a missing log never
+makes a skill fail.
+"""
+import os
+import sys
+from contextlib import contextmanager, nullcontext
+
+def _log_dirs():
+    if os.environ.get("SKILL_LOG_DIR"):
+        yield os.environ["SKILL_LOG_DIR"]
+    yield os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "logging")
+    yield os.path.join(os.getcwd(), "._", "logging")
+
+for _log_dir in _log_dirs():
+    if os.path.isfile(os.path.join(_log_dir, "skill_profile.py")):
+        sys.path.insert(0, os.path.normpath(_log_dir))
+        break
+
+try:
+    import skill_profile
+except ImportError:
+    skill_profile = None
+
+class NullProfiler:
+    """Stands in for skill_profile.Profiler when the logger is unavailable."""
+
+    def phase(self, name):
+        return nullcontext()
+
+    @contextmanager
+    def call(self, command, args=None):
+        yield {}
+
+def start(skill):
+    return skill_profile.start(skill) if skill_profile else NullProfiler()
+
+def phase(name):
+    return skill_profile.phase(name) if skill_profile else nullcontext()
@@ -2,103 +2,262 @@
 import os
 import sys
 import re
+import json
+import argparse
 
-def update_humans(skill_name, usage, triggers, requires="", library=""):
-    humans_path = "HUMANS.md"
-    if not os.path.exists(humans_path):
-        print(f"Error: {humans_path} not found.")
-        sys.exit(1)
+import profiling
 
-    with open(humans_path, 'r') as f:
-        content = f.read()
+PROFILER = profiling.start("skill-creator")
 
-    # 1. Prevent duplicate skill entries in the table
-    if f"| `{skill_name}` |" in content:
-        print(f"Skill `{skill_name}` already exists in HUMANS.md table. Skipping table update.")
-    else:
-        # --- TABLE UPDATE WITH SORTING ---
-        table_pattern = r'(## Additional Loaded Skills.*?\n\|.*?\n\|[- \|\:]+?\n)((?:\|.*?\n)*)'
-        match = re.search(table_pattern, content, re.DOTALL)
+HUMANS_PATH = "HUMANS.md"
+TABLE_HEADING = "## Additional Loaded Skills"
+SEPARATOR_PATTERN = re.compile(r'^\|[- \|\:]+\|?\s*$')
 
-        if not match:
-            print("Error: Could not find '## Additional Loaded Skills' table structure.")
-            sys.exit(1)
+class HumansDocument:
+    """HUMANS.md parsed once into the sections the registry edits.
+
+    The document is kept as a list of lines; the skills table rows and the
+    setup shell block are indexed so every edit is applied in memory and the
+    file is rendered and written exactly once.
+    """
+
+    def __init__(self, content):
+        self.lines = content.split('\n')
+        self._parse_table()
+        self._parse_shell_block()
+        self.table_changed = False
+
+    def _parse_table(self):
+        heading = next((i for i, line in enumerate(self.lines) if line.startswith(TABLE_HEADING)), None)
+        if heading is None:
+            raise ValueError(f"Could not find '{TABLE_HEADING}' table structure.")
+
+        header = next((i for i in range(heading + 1, len(self.lines)) if self.lines[i].startswith('|')), None)
+        if header is None or header + 1 >= len(self.lines) or not SEPARATOR_PATTERN.match(self.lines[header + 1]):
+            raise ValueError(f"Could not find '{TABLE_HEADING}' table structure.")
+
+        self.rows_start = header + 2
+        self.rows_end = self.rows_start
+        while self.rows_end < len(self.lines) and self.lines[self.rows_end].startswith('|'):
+            self.rows_end += 1
+        self.rows = [line for line in self.lines[self.rows_start:self.rows_end] if line.strip()]
+        self.row_names = {self._row_name(row) for row in self.rows}
 
-        header_part = match.group(1)
-        existing_rows_text = match.group(2).strip()
-        rows = [line for line in existing_rows_text.split('\n') if line.strip()]
+    @staticmethod
+    def _row_name(row):
+        match = re.match(r'^\|\s*`([^`]+)`\s*\|', row)
+        return match.group(1) if match else None
 
-        # Format 'requires' nicely
+    def _parse_shell_block(self):
+        self.shell_lines = None
+        self.pip_index = {}
+        start = next((i for i, line in enumerate(self.lines) if line.strip() == "```shell"), None)
+        if start is None:
+            return
+        end = next((i for i in range(start + 1, len(self.lines)) if self.lines[i].strip() == "```"), None)
+        if end is None:
+            return
+        self.shell_start = start + 1
+        self.shell_end = end
+        self.shell_lines = self.lines[self.shell_start:self.shell_end]
+        for i, line in enumerate(self.shell_lines):
+            if line.strip().startswith("pip install "):
+                self.pip_index[line.strip()] = i
+
+    def has_skill(self, skill_name):
+        return skill_name in self.row_names
+
+    def add_row(self, skill_name, usage, triggers, requires):
         if requires:
-            formatted_requires = ", ".join([f"`{r.strip()}`" for r in requires.split(",") if r.strip()])
+            formatted_requires = ", ".join(f"`{r}`" for r in requires)
             formatted_requires += " as environment variable"
         else:
             formatted_requires = ""
 
-        new_row = f"| `{skill_name}` | {usage} | {triggers} | {formatted_requires} |"
-        rows.append(new_row)
+        self.rows.append(f"| `{skill_name}` | {usage} | {triggers} | {formatted_requires} |")
+        self.row_names.add(skill_name)
+        self.table_changed = True
+
+    def add_library(self, skill_name, lib):
+        if self.shell_lines is None:
+            return
+        pip_cmd = f"pip install {lib}"
+        i = self.pip_index.get(pip_cmd)
+        if i is not None:
+            # Library already exists, update the comment above it
+            if i > 0 and self.shell_lines[i - 1].strip().startswith('#'):
+                comment_line = self.shell_lines[i - 1]
+                if skill_name not in comment_line:
+                    self.shell_lines[i - 1] = comment_line + f", {skill_name}"
+        else:
+            # Add new entry at the end of the shell block
+            if self.shell_lines and self.shell_lines[-1].strip():
+                self.shell_lines.append("")
+            self.shell_lines.append(f"# {skill_name}")
+            self.shell_lines.append(pip_cmd)
+            self.pip_index[pip_cmd] = len(self.shell_lines) - 1
+
+    def render(self):
+        lines = list(self.lines)
+        # Splice the later section first so earlier indices stay valid.
+        sections = [(self.rows_start, self.rows_end, self._sorted_rows())]
+        if self.shell_lines is not None:
+            sections.append((self.shell_start, self.shell_end, self.shell_lines))
+        for start, end, replacement in sorted(sections, reverse=True):
+            lines[start:end] = replacement
+        return '\n'.join(lines)
 
+    def _sorted_rows(self):
+        if not self.table_changed:
+            return self.lines[self.rows_start:self.rows_end]
         # Alphabetical sort
-        rows.sort(key=lambda x: x.lower())
-        sorted_table_text = header_part + "\n".join(rows) + "\n"
-        content = content.replace(match.group(0), sorted_table_text)
-
-    # --- SHELL SCRIPT UPDATE (Multiple Libraries) ---
-    if library:
-        lib_list = [l.strip() for l in library.split(",") if l.strip()]
-
-        for lib in lib_list:
-            pip_cmd = f"pip install {lib}"
-            if pip_cmd in content:
-                # Library already exists, update the comment above it
-                lines = content.split('\n')
-                for i, line in enumerate(lines):
-                    if pip_cmd in line:
-                        if i > 0 and lines[i-1].strip().startswith('#'):
-                            comment_line = lines[i-1]
-                            if skill_name not in comment_line:
-                                lines[i-1] = comment_line + f", {skill_name}"
-                content = '\n'.join(lines)
-            else:
-                # Add new entry at the end of the shell block
-                shell_block_pattern = r'(```shell\n.*?)(\n```)'
-                shell_match = re.search(shell_block_pattern, content, re.DOTALL)
-
-                if shell_match:
-                    inner_content = shell_match.group(1)
-                    # Ensure inner_content ends with a newline
-                    if not inner_content.endswith('\n'):
-                        inner_content += '\n'
-
-                    new_entry = f"# {skill_name}\n{pip_cmd}\n"
-
-                    content = (
-                        content[:shell_match.start(1)] +
-                        inner_content +
-                        new_entry +
-                        content[shell_match.start(2):]
-                    )
-
-    # 4. Save changes
-    with open(humans_path, 'w') as f:
+        return sorted(self.rows, key=lambda x: x.lower())
+
+def _split_list(value):
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+def apply_entries(document, entries):
+    """Apply registry entries to a parsed document; returns the names that were added."""
+    added = []
+    for entry in entries:
+        skill_name = entry["name"]
+        # 1. Prevent duplicate skill entries in the table
+        if document.has_skill(skill_name):
+            print(f"Skill `{skill_name}` already exists in HUMANS.md table. Skipping table update.")
+        else:
+            document.add_row(skill_name, entry.get("usage", ""), entry.get("triggers", ""),
+                             _split_list(entry.get("requires")))
+            added.append(skill_name)
+
+        for lib in _split_list(entry.get("library")):
+            document.add_library(skill_name, lib)
+    return added
+
+def write_atomic(path, content):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
         f.write(content)
+    os.replace(tmp_path, path)
 
-    print(f"Successfully updated HUMANS.md with `{skill_name}` and its dependencies.")
+def update_humans_batch(entries, humans_path=HUMANS_PATH):
+    if not os.path.exists(humans_path):
+        print(f"Error: {humans_path} not found.")
+        sys.exit(1)
+
+    with profiling.phase("io"), open(humans_path, 'r') as f:
+        content = f.read()
+
+    try:
+        with profiling.phase("parse"):
+            document = HumansDocument(content)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    apply_entries(document, entries)
+
+    new_content = document.render()
+    if new_content == content:
+        print("HUMANS.md is up to date; no changes made.")
+        return
+
+    with profiling.phase("io"):
+        write_atomic(humans_path, new_content)
+
+    names = ", ".join(f"`{e['name']}`" for e in entries)
+    print(f"Successfully updated HUMANS.md with {names} and its dependencies.")
+
+def update_humans(skill_name, usage, triggers, requires="", library=""):
+    update_humans_batch([{
+        "name": skill_name,
+        "usage": usage,
+        "triggers": triggers,
+        "requires": requires,
+        "library": library,
+    }])
+
+def load_manifest(manifest_path):
+    """Read a JSON list of {name, usage, triggers, requires, library} objects."""
+    with open(manifest_path, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("skills", [])
+    return data
+
+def validate_entries(entries):
+    """Return error messages for entries that cannot be registered."""
+    if not isinstance(entries, list):
+        return ["Manifest must be a list of skills or an object with a 'skills' list."]
+    errors = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            errors.append(f"Entry {i}: expected an object, got {type(entry).__name__}.")
+        elif not isinstance(entry.get("name"), str) or not entry["name"].strip():
+            errors.append(f"Entry {i}: missing 'name'.")
+    return errors
+
+def entries_from_registry(skills_dir):
+    """Derive registry entries from the SKILL.md frontmatter of every skill.
+
+    `usage` is the first sentence of the description; `triggers`, `requires`
+    and `library` are read from optional frontmatter keys of the same name.
+    """
+    import yaml
+
+    entries = []
+    for item in sorted(os.listdir(skills_dir)):
+        skill_md = os.path.join(skills_dir, item, "SKILL.md")
+        if not os.path.isfile(skill_md):
+            continue
+        with open(skill_md, 'r') as f:
+            match = re.match(r'^---\n(.*?)\n---\n', f.read(), re.DOTALL)
+        metadata = (yaml.safe_load(match.group(1)) if match else None) or {}
+        description = str(metadata.get("description", ""))
+        entries.append({
+            "name": metadata.get("name", item),
+            "usage": re.split(r'(?<=\.)\s', description, maxsplit=1)[0],
+            "triggers": metadata.get("triggers", ""),
+            "requires": metadata.get("requires", ""),
+            "library": metadata.get("library", ""),
+        })
+    return entries
 
 def main():
     # Usage: script.py "name" "usage" "triggers" "REQ1, REQ2" "LIB1, LIB2"
-    if len(sys.argv) < 4:
-        print("Usage: update_humans.py <skill_name> <usage> <triggers> [requires] [library]")
-        print("Note: Multiple requirements or libraries should be comma-separated strings.")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Register skills in HUMANS.md.",
+        epilog="Multiple requirements or libraries should be comma-separated strings.")
+    parser.add_argument("skill_name", nargs="?")
+    parser.add_argument("usage", nargs="?")
+    parser.add_argument("triggers", nargs="?")
+    parser.add_argument("requires", nargs="?", default="")
+    parser.add_argument("library", nargs="?", default="")
+    parser.add_argument("--manifest", help="JSON file with a list of skills to register in one pass.")
+    parser.add_argument("--from-registry", metavar="SKILLS_DIR", nargs="?", const="._/skills",
+                        help="Register every skill found in SKILLS_DIR (default: ._/skills).")
+
+    args = parser.parse_args()
 
-    skill_name = sys.argv[1]
-    usage = sys.argv[2]
-    triggers = sys.argv[3]
-    requires = sys.argv[4] if len(sys.argv) > 4 else ""
-    library = sys.argv[5] if len(sys.argv) > 5 else ""
+    with PROFILER.call("update_humans", sys.argv[1:]):
+        if args.manifest or args.from_registry:
+            entries = load_manifest(args.manifest) if args.manifest else entries_from_registry(args.from_registry)
+            errors = validate_entries(entries)
+            if errors:
+                for error in errors:
+                    print(f"Error: {error}")
+                sys.exit(1)
+            update_humans_batch(entries)
+            return
+
+        if not args.triggers:
+            print("Usage: update_humans.py <skill_name> <usage> <triggers> [requires] [library]")
+            print("       update_humans.py --manifest <skills.json> | --from-registry [skills_dir]")
+            print("Note: Multiple requirements or libraries should be comma-separated strings.")
+            sys.exit(1)
 
-    update_humans(skill_name, usage, triggers, requires, library)
+        update_humans(args.skill_name, args.usage, args.triggers, args.requires, args.library)
 
 if __name__ == "__main__":
     main()
@@ -1,10 +1,30 @@
 #!/usr/bin/env python3
 import os
 import sys
-import yaml
 import re
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+import profiling
+
+PROFILER = profiling.start("skill-creator")
+
+# Bump when the validation rules change so cached results are discarded.
+VALIDATOR_VERSION = 1
+# Kept outside any skill tree so the cache never ends up inside a packaged skill.
+CACHE_PATH = os.path.join(os.environ.get("SKILL_CACHE_DIR", os.path.join(tempfile.gettempdir(), "jules-skills")), "validate-cache.json")
+SKIPPED_DIRS = {"__pycache__", ".git", "node_modules", ".venv", ".tox"}
 
 def validate_skill(skill_path):
+    # Imported lazily so cached runs never pay for PyYAML.
+    with profiling.phase("import"):
+        import yaml
+
     errors = []
 
     if not os.path.isdir(skill_path):
@@ -16,7 +36,7 @@ def validate_skill(skill_path):
         return errors
 
     try:
-        with open(skill_md_path, 'r') as f:
+        with profiling.phase("io"), open(skill_md_path, 'r') as f:
             content = f.read()
 
         # Match YAML frontmatter
@@ -26,7 +46,8 @@ def validate_skill(skill_path):
             return errors
 
         frontmatter_raw = match.group(1)
-        metadata = yaml.safe_load(frontmatter_raw)
+        with profiling.phase("parse"):
+            metadata = yaml.safe_load(frontmatter_raw)
 
         if not metadata:
             errors.append("Error: YAML frontmatter is empty")
@@ -68,20 +89,181 @@ def validate_skill(skill_path):
 
     return errors
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: validate_skill.py <path/to/skill-folder>")
-        sys.exit(1)
+def discover_skills(root):
+    """Return every directory below `root` that contains a SKILL.md."""
+    skills = []
+    for current, dirs, files in os.walk(root):
+        if "SKILL.md" in files:
+            skills.append(current)
+            dirs[:] = []
+            continue
+        dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS)
+    return sorted(skills)
+
+def _cache_key(skill_path):
+    with open(os.path.join(skill_path, "SKILL.md"), "rb") as f:
+        content = f.read()
+    # The directory name is part of the rules ('name' must match it).
+    digest = hashlib.sha256(content)
+    digest.update(os.path.basename(os.path.abspath(skill_path)).encode("utf-8"))
+    digest.update(str(VALIDATOR_VERSION).encode("utf-8"))
+    return digest.hexdigest()
 
-    skill_path = sys.argv[1]
+def load_cache(cache_path):
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, cache_path)
+
+def _validate_timed(skill_path):
+    start = time.perf_counter()
     errors = validate_skill(skill_path)
+    return errors, round(time.perf_counter() - start, 6)
+
+def validate_tree(root, jobs=1, cache_path=None):
+    """Validate every skill below `root`, reusing cached results.
+
+    Uncached skills are validated in this process, or spread over `jobs`
+    worker processes: the work is pure-Python YAML parsing, so threads
+    would not run it in parallel.
+    """
+    start = time.perf_counter()
+    cache = load_cache(cache_path) if cache_path else {}
+    skills = discover_skills(root)
+
+    results = []
+    pending = []
+    for skill_path in skills:
+        lookup_start = time.perf_counter()
+        with profiling.phase("io"):
+            key = _cache_key(skill_path)
+        entry = cache.get(os.path.abspath(skill_path))
+        cached = bool(entry and entry.get("hash") == key)
+        result = {
+            "skill": os.path.basename(os.path.abspath(skill_path)),
+            "path": skill_path,
+            "valid": True,
+            "errors": entry["errors"] if cached else [],
+            "cached": cached,
+            "hash": key,
+            "duration": round(time.perf_counter() - lookup_start, 6),
+        }
+        results.append(result)
+        if not cached:
+            pending.append(result)
 
-    if errors:
-        for error in errors:
-            print(error)
-        sys.exit(1)
+    paths = [r["path"] for r in pending]
+    if jobs and jobs > 1 and len(paths) > 1:
+        # Worker processes time their own phases; count the wait as parsing here.
+        with profiling.phase("parse"), ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(_validate_timed, paths, chunksize=max(1, len(paths) // (jobs * 4))))
     else:
-        print(f"Skill at {skill_path} is valid.")
+        outcomes = [_validate_timed(path) for path in paths]
+    for r, (errors, duration) in zip(pending, outcomes):
+        r["errors"] = errors
+        r["duration"] = duration
+    for r in results:
+        r["valid"] = not r["errors"]
+
+    if cache_path:
+        # The cache is shared between roots; replace only the entries below this one.
+        prefix = os.path.join(os.path.abspath(root), "")
+        kept = {path: entry for path, entry in cache.items() if not path.startswith(prefix)}
+        kept.update({os.path.abspath(r["path"]): {"hash": r["hash"], "errors": r["errors"]} for r in results})
+        save_cache(cache_path, kept)
+
+    for r in results:
+        del r["hash"]
+    return {
+        "root": root,
+        "total": len(results),
+        "failed": sum(1 for r in results if not r["valid"]),
+        "cached": sum(1 for r in results if r["cached"]),
+        "duration": round(time.perf_counter() - start, 6),
+        "results": results,
+    }
+
+def format_junit(report):
+    suite = ElementTree.Element("testsuite", {
+        "name": "skills",
+        "tests": str(report["total"]),
+        "failures": str(report["failed"]),
+        "errors": "0",
+        "time": f"{report['duration']:.6f}",
+    })
+    for r in report["results"]:
+        case = ElementTree.SubElement(suite, "testcase", {
+            "classname": "skills",
+            "name": r["skill"],
+            "file": r["path"],
+            "time": f"{r['duration']:.6f}",
+        })
+        if r["errors"]:
+            failure = ElementTree.SubElement(case, "failure", {"message": r["errors"][0]})
+            failure.text = "\n".join(r["errors"])
+        if r["cached"]:
+            ElementTree.SubElement(case, "system-out").text = "cached"
+    return ElementTree.tostring(suite, encoding="unicode")
+
+def format_text(report):
+    lines = []
+    for r in report["results"]:
+        status = "OK" if r["valid"] else "FAIL"
+        suffix = " (cached)" if r["cached"] else ""
+        lines.append(f"[{status}] {r['path']} {r['duration'] * 1000:.1f}ms{suffix}")
+        for error in r["errors"]:
+            lines.append(f"    {error}")
+    lines.append(f"{report['total']} skills, {report['failed']} failed, "
+                 f"{report['cached']} cached in {report['duration']:.3f}s")
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a skill folder, or every skill below a root with --all.")
+    parser.add_argument("skill_path", nargs="?", help="Path to the skill folder.")
+    parser.add_argument("--all", metavar="ROOT", help="Discover and validate every skill below ROOT.")
+    parser.add_argument("--format", choices=["text", "json", "junit"], default="text", help="Output format for --all.")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for uncached skills in --all (default: 1, sequential).")
+    parser.add_argument("--cache", help=f"Result cache file for --all (default: {CACHE_PATH}).")
+    parser.add_argument("--no-cache", action="store_true", help="Validate every skill, ignoring the cache.")
+
+    args = parser.parse_args()
+
+    with PROFILER.call("validate", sys.argv[1:]):
+        if args.all:
+            cache_path = None if args.no_cache else (args.cache or CACHE_PATH)
+            report = validate_tree(args.all, args.jobs, cache_path)
+            if args.format == "json":
+                print(json.dumps(report, indent=2))
+            elif args.format == "junit":
+                print(format_junit(report))
+            else:
+                print(format_text(report))
+            if not report["total"]:
+                print(f"Error: no skills (directories with a SKILL.md) found below {args.all}", file=sys.stderr)
+                sys.exit(1)
+            sys.exit(1 if report["failed"] else 0)
+
+        if not args.skill_path:
+            print("Usage: validate_skill.py <path/to/skill-folder> | --all <root>")
+            sys.exit(1)
+
+        skill_path = args.skill_path
+        errors = validate_skill(skill_path)
+
+        if errors:
+            for error in errors:
+                print(error)
+            sys.exit(1)
+        else:
+            print(f"Skill at {skill_path} is valid.")
 
 if __name__ == "__main__":
     main()